@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Validate and Estimate Costs in One Pass
+
+Parses an app-config.yml file once and feeds the result to both the
+validator (validate.py) and the cost estimator (scripts/estimate-costs.py),
+instead of each script reading and parsing the file separately.
+
+Usage:
+    python run.py [--pretty] <path-to-app-config.yml>
+
+Returns:
+    Exit code 0 if valid, 1 if invalid
+    Prints JSON with validation results and, for valid configs, the
+    markdown cost report under "cost_report"
+"""
+
+import sys
+import argparse
+import importlib.util
+from pathlib import Path
+
+from validate import AppConfigValidator, write_result
+
+ESTIMATOR_PATH = Path(__file__).parent.parent.parent / "scripts/estimate-costs.py"
+
+
+def _load_cost_estimator():
+    """Import CostEstimator from estimate-costs.py (not an importable module name)"""
+    spec = importlib.util.spec_from_file_location("estimate_costs", ESTIMATOR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.CostEstimator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate app-config.yml and estimate its costs")
+    parser.add_argument("config", help="Path to app-config.yml")
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the JSON output for humans"
+    )
+    args = parser.parse_args()
+
+    config_path = Path(args.config)
+    validator = AppConfigValidator()
+
+    config, errors = validator.load(config_path)
+    is_valid = False
+    if not errors:
+        is_valid, errors = validator.validate_parsed(config, config_path)
+
+    # Only estimate costs for configs the platform would accept
+    cost_report = None
+    if is_valid:
+        CostEstimator = _load_cost_estimator()
+        cost_report = CostEstimator.from_parsed(config).generate_markdown_report()
+
+    result = {
+        "is_valid": is_valid,
+        "config_file": str(config_path),
+        "errors": errors,
+        "cost_report": cost_report
+    }
+
+    write_result(result, pretty=args.pretty)
+
+    sys.exit(0 if is_valid else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -6,36 +6,229 @@ This script validates app-config.yml files against the platform schema.
 It provides detailed, actionable error messages to help developers fix issues quickly.
 
 Usage:
-    python validate.py <path-to-app-config.yml>
+    python validate.py <path-to-app-config.yml> [<path-to-app-config.yml> ...]
+    git diff --name-only | grep app-config.yml | python validate.py --from-stdin
+    python validate.py --pretty <path-to-app-config.yml>
+    python validate.py --fail-fast <path-to-app-config.yml>
 
 Returns:
-    Exit code 0 if valid, 1 if invalid
-    Prints JSON with validation results
+    Exit code 0 if all configs are valid, 1 if any is invalid
+    Prints JSON with validation results (an object for a single config,
+    an array of objects when several configs are validated). Output is
+    compact unless --pretty is given.
 """
 
+import io
+import os
+import re
 import sys
 import json
+import argparse
+import functools
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 import yaml
 from pathlib import Path
-from typing import Dict, List, Tuple
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+# libyaml-backed loader when PyYAML was built with it, pure Python otherwise
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
 
 try:
     import jsonschema
-    from jsonschema import validate, ValidationError
+    from jsonschema import ValidationError
+    from jsonschema.exceptions import best_match, relevance
 except ImportError:
     print("Error: jsonschema not installed. Run: pip install jsonschema pyyaml")
     sys.exit(1)
 
+# Optional: fastjsonschema generates a specialised validation function for the
+# schema, which is much faster for the common case of a valid config.
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# Optional: orjson serialises results much faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Parsed schema files and compiled validators, keyed by resolved schema path
+_SCHEMA_CACHE: Dict[Path, Dict] = {}
+_VALIDATOR_CACHE: Dict[Path, jsonschema.Draft7Validator] = {}
+_FAST_VALIDATOR_CACHE: Dict[Path, Callable] = {}
+
+# Team registry consulted by the custom validations
+_REGISTRY_PATH = Path(__file__).parent.parent.parent / "apps/_registry.yml"
+
+# Directory listings used for file presence checks, keyed by directory path
+_DIR_ENTRIES_CACHE: Dict[Path, FrozenSet[str]] = {}
+
+_DEFAULT_FIELD_EXPLANATION = "This field is required by the platform configuration"
+
+# Fix suggestions for schema "pattern" keywords, keyed by the compiled pattern
+_PATTERN_HINTS: Dict[re.Pattern, str] = {
+    re.compile(r"^[a-z0-9-]{3,15}$"): (
+        "Use only lowercase letters, numbers, and hyphens. "
+        "Length must be 3-15 characters. Example: 'my-app' or 'api-service'"
+    ),
+}
+
+
+def _yaml_stream(raw: bytes, path: Path) -> io.BytesIO:
+    """Wrap file bytes in a named stream so YAML errors report the file path"""
+    stream = io.BytesIO(raw)
+    stream.name = str(path)
+    return stream
+
+
+@functools.lru_cache(maxsize=8)
+def _load_registry(path_str: str, mtime_ns: int) -> FrozenSet[str]:
+    """Return the teams registered in _registry.yml
+
+    mtime_ns is only part of the cache key, so an edited registry is re-read.
+    """
+    path = Path(path_str)
+    registry = yaml.load(_yaml_stream(path.read_bytes(), path), Loader=_YAMLLoader)
+    return frozenset(app.get('team') for app in registry.get('apps', []))
+
+
+def _registry_mtime_ns() -> Optional[int]:
+    """Modification time of the registry, or None if it does not exist"""
+    try:
+        return _REGISTRY_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _dir_has(path: Path, filename: str) -> bool:
+    """Check a file exists using one cached scandir per directory"""
+    entries = _DIR_ENTRIES_CACHE.get(path)
+    if entries is None:
+        try:
+            with os.scandir(path) as it:
+                entries = frozenset(entry.name for entry in it)
+        except (FileNotFoundError, NotADirectoryError):
+            entries = frozenset()
+        _DIR_ENTRIES_CACHE[path] = entries
+    return filename in entries
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_path(path: Tuple) -> str:
+    """Format a jsonschema error path as a dotted field path"""
+    return ".".join(map(str, path)) or "root"
+
+
+def dumps_result(result, pretty: bool = False) -> bytes:
+    """Serialise validation results to UTF-8: compact for machines, indented with pretty"""
+    if pretty:
+        return json.dumps(result, indent=2).encode("utf-8")
+    if orjson is not None:
+        return orjson.dumps(result)
+    return json.dumps(result, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def write_result(result, pretty: bool = False):
+    """Write validation results to stdout as UTF-8, whatever the console encoding"""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(dumps_result(result, pretty=pretty) + b"\n")
+    sys.stdout.buffer.flush()
+
 
 class AppConfigValidator:
     """Validates app configuration with helpful error messages"""
 
-    def __init__(self, schema_path: Path = None):
+    # Why each field matters, built once at import rather than per error
+    _FIELD_EXPLANATIONS = MappingProxyType({
+        "app.name": (
+            "App name is used in all Azure resource names (e.g., rg-{name}-dev). "
+            "Must be DNS-safe and unique across the platform."
+        ),
+        "app.team": (
+            "Team ownership is used for cost allocation and access control. "
+            "Helps us track who owns what and how much each team spends."
+        ),
+        "app.region": (
+            "Azure region determines where your app runs. "
+            "Affects latency and compliance requirements."
+        ),
+        "components.backend.cpu": (
+            "CPU allocation affects both performance and monthly costs. "
+            "1 core ≈ £20/month. Start low and scale up if needed."
+        ),
+        "components.backend.memory": (
+            "Memory allocation in GB. Affects cost (~£2.5/GB/month) and app performance. "
+            "Most apps work fine with 1-2GB."
+        ),
+        "components.backend.port": (
+            "Port your backend listens on. Must match what your Dockerfile EXPOSEs. "
+            "Used for health checks and routing."
+        ),
+        "components.database.enabled": (
+            "Deploying a database adds ~£25/month to costs but provides managed, backed-up storage."
+        ),
+        "environment": (
+            "Environment (dev/staging/prod) affects resource naming and potentially sizing. "
+            "Helps organize deployments."
+        )
+    })
+
+    def __init__(self, schema_path: Path = None, fail_fast: bool = False):
+        # fail_fast: report only the most relevant schema error, not all of them
+        self.fail_fast = fail_fast
+
         if schema_path is None:
             schema_path = Path(__file__).parent / "schemas/app-config.schema.json"
 
-        with open(schema_path) as f:
-            self.schema = json.load(f)
+        key = Path(schema_path).resolve()
+        schema = _SCHEMA_CACHE.get(key)
+        if schema is None:
+            with open(key) as f:
+                schema = json.load(f)
+            _SCHEMA_CACHE[key] = schema
+        self.schema = schema
+
+        # Check and compile the schema once instead of on every validate() call
+        validator = _VALIDATOR_CACHE.get(key)
+        if validator is None:
+            jsonschema.Draft7Validator.check_schema(self.schema)
+            validator = jsonschema.Draft7Validator(
+                self.schema, format_checker=jsonschema.FormatChecker()
+            )
+            _VALIDATOR_CACHE[key] = validator
+        self._validator = validator
+
+        self._fast_validate = None
+        if fastjsonschema is not None:
+            fast_validate = _FAST_VALIDATOR_CACHE.get(key)
+            if fast_validate is None:
+                # use_default=False: never mutate the config with schema defaults
+                fast_validate = fastjsonschema.compile(self.schema, use_default=False)
+                _FAST_VALIDATOR_CACHE[key] = fast_validate
+            self._fast_validate = fast_validate
+
+        # (resolved path, content digest, registry mtime) of configs that already
+        # passed, so re-validating an unchanged file in the same process is free.
+        # The registry mtime keeps the team check honest when the registry changes.
+        self._valid_digests: Set[Tuple[Path, bytes, Optional[int]]] = set()
+
+    def _passes_schema_fast(self, config: Dict) -> bool:
+        """Cheap validity check using the generated fastjsonschema function"""
+        if self._fast_validate is None:
+            return False
+        try:
+            self._fast_validate(config)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return True
 
     def validate(self, config_path: Path) -> Tuple[bool, List[Dict]]:
         """
@@ -44,40 +237,94 @@ class AppConfigValidator:
         Returns:
             (is_valid, errors): Tuple of boolean and list of error dicts
         """
-        errors = []
-
-        # Step 1: Parse YAML
         try:
-            with open(config_path) as f:
-                config = yaml.safe_load(f)
+            raw = config_path.read_bytes()
         except FileNotFoundError:
-            errors.append({
-                "error": f"File not found: {config_path}",
-                "why_this_matters": "We need an app-config.yml file to know how to deploy your app",
-                "fix": f"Create {config_path} using the template from apps/_template/",
-                "severity": "critical",
-                "docs_link": "platform/docs/onboarding.md#step-2-create-configuration"
-            })
+            return False, [self._file_not_found_error(config_path)]
+
+        digest_key = (
+            config_path.resolve(),
+            hashlib.blake2b(raw, digest_size=16).digest(),
+            _registry_mtime_ns()
+        )
+        if digest_key in self._valid_digests:
+            return True, []
+
+        config, errors = self._parse(raw, config_path)
+        if errors:
             return False, errors
+
+        is_valid, errors = self.validate_parsed(config, config_path)
+        if is_valid:
+            self._valid_digests.add(digest_key)
+        return is_valid, errors
+
+    def load(self, config_path: Path) -> Tuple[Optional[Dict], List[Dict]]:
+        """
+        Read and parse app-config.yml file
+
+        Returns:
+            (config, errors): Parsed config (None on failure) and list of error dicts
+        """
+        try:
+            raw = config_path.read_bytes()
+        except FileNotFoundError:
+            return None, [self._file_not_found_error(config_path)]
+
+        return self._parse(raw, config_path)
+
+    def _parse(self, raw: bytes, config_path: Path) -> Tuple[Optional[Dict], List[Dict]]:
+        """Parse YAML bytes, explaining syntax errors"""
+        try:
+            return yaml.load(_yaml_stream(raw, config_path), Loader=_YAMLLoader), []
         except yaml.YAMLError as e:
-            errors.append({
+            return None, [{
                 "error": "Failed to parse YAML",
                 "details": str(e),
                 "why_this_matters": "YAML syntax errors prevent us from reading your configuration",
                 "fix": "Check YAML syntax at https://www.yamllint.com/ or use a YAML linter",
                 "severity": "critical"
-            })
-            return False, errors
+            }]
 
-        # Step 2: Validate against schema
-        try:
-            jsonschema.validate(config, self.schema)
-        except ValidationError as e:
-            error_dict = self._explain_validation_error(e, config_path)
-            errors.append(error_dict)
-            return False, errors
+    def _file_not_found_error(self, config_path: Path) -> Dict:
+        """Explain a missing app-config.yml file"""
+        return {
+            "error": f"File not found: {config_path}",
+            "why_this_matters": "We need an app-config.yml file to know how to deploy your app",
+            "fix": f"Create {config_path} using the template from apps/_template/",
+            "severity": "critical",
+            "docs_link": "platform/docs/onboarding.md#step-2-create-configuration"
+        }
+
+    def validate_parsed(self, config: Dict, config_path: Path) -> Tuple[bool, List[Dict]]:
+        """
+        Validate an already-parsed app config
+
+        config_path is still needed to resolve component directories.
+
+        Returns:
+            (is_valid, errors): Tuple of boolean and list of error dicts
+        """
+        errors = []
 
-        # Step 3: Custom validations
+        # Step 1: Validate against schema. Valid configs only pay for the fast
+        # check; jsonschema is used to explain what is wrong. All schema errors
+        # are reported (most relevant first) so they can be fixed in one go.
+        if not self._passes_schema_fast(config):
+            if self.fail_fast:
+                schema_errors = [best_match(self._validator.iter_errors(config))]
+            else:
+                schema_errors = sorted(
+                    self._validator.iter_errors(config), key=relevance, reverse=True
+                )
+            for schema_error in schema_errors:
+                if schema_error is not None:
+                    errors.append(self._explain_validation_error(schema_error, config_path))
+            if errors:
+                # Custom checks rely on the types the schema guarantees
+                return False, errors
+
+        # Step 2: Custom validations
         custom_errors = self._custom_validations(config, config_path)
         errors.extend(custom_errors)
 
@@ -85,7 +332,7 @@ class AppConfigValidator:
 
     def _explain_validation_error(self, error: ValidationError, config_path: Path) -> Dict:
         """Convert jsonschema error to helpful explanation"""
-        field_path = ".".join(str(p) for p in error.path) if error.path else "root"
+        field_path = _fmt_path(tuple(error.absolute_path))
 
         # Get explanation for this field
         explanation = self._get_field_explanation(field_path)
@@ -102,50 +349,18 @@ class AppConfigValidator:
 
     def _get_field_explanation(self, field_path: str) -> str:
         """Explain why each field matters"""
-        explanations = {
-            "app.name": (
-                "App name is used in all Azure resource names (e.g., rg-{name}-dev). "
-                "Must be DNS-safe and unique across the platform."
-            ),
-            "app.team": (
-                "Team ownership is used for cost allocation and access control. "
-                "Helps us track who owns what and how much each team spends."
-            ),
-            "app.region": (
-                "Azure region determines where your app runs. "
-                "Affects latency and compliance requirements."
-            ),
-            "components.backend.cpu": (
-                "CPU allocation affects both performance and monthly costs. "
-                "1 core ≈ £20/month. Start low and scale up if needed."
-            ),
-            "components.backend.memory": (
-                "Memory allocation in GB. Affects cost (~£2.5/GB/month) and app performance. "
-                "Most apps work fine with 1-2GB."
-            ),
-            "components.backend.port": (
-                "Port your backend listens on. Must match what your Dockerfile EXPOSEs. "
-                "Used for health checks and routing."
-            ),
-            "components.database.enabled": (
-                "Deploying a database adds ~£25/month to costs but provides managed, backed-up storage."
-            ),
-            "environment": (
-                "Environment (dev/staging/prod) affects resource naming and potentially sizing. "
-                "Helps organize deployments."
-            )
-        }
-        return explanations.get(field_path, "This field is required by the platform configuration")
+        return self._FIELD_EXPLANATIONS.get(field_path, _DEFAULT_FIELD_EXPLANATION)
 
     def _get_fix_suggestion(self, error: ValidationError) -> str:
         """Provide specific fix suggestions based on error type"""
-        if "pattern" in error.schema:
-            pattern = error.schema["pattern"]
-            if pattern == "^[a-z0-9-]{3,15}$":
-                return (
-                    f"Use only lowercase letters, numbers, and hyphens. "
-                    f"Length must be 3-15 characters. Example: 'my-app' or 'api-service'"
-                )
+        pattern = error.schema.get("pattern")
+        if pattern is not None:
+            hint = next(
+                (msg for regex, msg in _PATTERN_HINTS.items() if regex.pattern == pattern),
+                None
+            )
+            if hint:
+                return hint
 
         if error.validator == "required":
             missing = error.message.split("'")[1]
@@ -166,7 +381,9 @@ class AppConfigValidator:
 
         return "Check the schema documentation for correct format"
 
-    def _get_docs_link(self, field_path: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_docs_link(field_path: str) -> str:
         """Return link to relevant documentation"""
         base_url = "platform/docs/configuration-reference.md"
         return f"{base_url}#{field_path.replace('.', '-')}"
@@ -175,13 +392,16 @@ class AppConfigValidator:
         """Additional validations beyond schema"""
         errors = []
         app_dir = config_path.parent
+        components = config.get('components') or {}
+        backend = components.get('backend') or {}
+        frontend = components.get('frontend') or {}
 
         # Check 1: If backend enabled, Dockerfile must exist
-        if config.get('components', {}).get('backend', {}).get('enabled'):
-            backend_dir = config.get('components', {}).get('backend', {}).get('directory', './backend')
+        if backend.get('enabled'):
+            backend_dir = backend.get('directory', './backend')
             dockerfile_path = app_dir / backend_dir / 'Dockerfile'
 
-            if not dockerfile_path.exists():
+            if not _dir_has(app_dir / backend_dir, 'Dockerfile'):
                 errors.append({
                     "error": f"Backend enabled but Dockerfile not found at {dockerfile_path}",
                     "why_this_matters": (
@@ -196,11 +416,11 @@ class AppConfigValidator:
                 })
 
         # Check 2: If frontend enabled, Dockerfile must exist
-        if config.get('components', {}).get('frontend', {}).get('enabled'):
-            frontend_dir = config.get('components', {}).get('frontend', {}).get('directory', './frontend')
+        if frontend.get('enabled'):
+            frontend_dir = frontend.get('directory', './frontend')
             dockerfile_path = app_dir / frontend_dir / 'Dockerfile'
 
-            if not dockerfile_path.exists():
+            if not _dir_has(app_dir / frontend_dir, 'Dockerfile'):
                 errors.append({
                     "error": f"Frontend enabled but Dockerfile not found at {dockerfile_path}",
                     "why_this_matters": "We need a Dockerfile to build your frontend container image",
@@ -209,7 +429,7 @@ class AppConfigValidator:
                 })
 
         # Check 3: Warn about high resource allocation (cost implications)
-        backend_cpu = config.get('components', {}).get('backend', {}).get('cpu', 0)
+        backend_cpu = backend.get('cpu', 0)
         if backend_cpu > 2.0:
             errors.append({
                 "error": f"Backend CPU allocation is high: {backend_cpu} cores",
@@ -222,48 +442,95 @@ class AppConfigValidator:
             })
 
         # Check 4: Ensure team is registered
+        # (the built-in pilot team is always allowed, so skip the registry)
         team = config.get('app', {}).get('team')
-        if team:
-            registry_path = Path(__file__).parent.parent.parent / "apps/_registry.yml"
-            if registry_path.exists():
-                with open(registry_path) as f:
-                    registry = yaml.safe_load(f)
-                    registered_teams = {app.get('team') for app in registry.get('apps', [])}
-                    if team not in registered_teams and team != 'pilot':
-                        errors.append({
-                            "error": f"Team '{team}' not found in registry",
-                            "why_this_matters": (
-                                "Teams must be registered for cost allocation and access control. "
-                                "This prevents typos and ensures proper ownership."
-                            ),
-                            "fix": (
-                                f"1. Add your team to apps/_registry.yml, OR\n"
-                                f"2. Use an existing team name: {', '.join(registered_teams)}"
-                            ),
-                            "severity": "warning"
-                        })
+        if team and team != 'pilot':
+            registry_mtime_ns = _registry_mtime_ns()
+            if registry_mtime_ns is not None:
+                registered_teams = _load_registry(
+                    str(_REGISTRY_PATH.resolve()), registry_mtime_ns
+                )
+                if team not in registered_teams:
+                    # Only build the sorted list when it goes into a message
+                    known_teams = sorted(t for t in registered_teams if t)
+                    errors.append({
+                        "error": f"Team '{team}' not found in registry",
+                        "why_this_matters": (
+                            "Teams must be registered for cost allocation and access control. "
+                            "This prevents typos and ensures proper ownership."
+                        ),
+                        "fix": (
+                            f"1. Add your team to apps/_registry.yml, OR\n"
+                            f"2. Use an existing team name: {', '.join(known_teams)}"
+                        ),
+                        "severity": "warning"
+                    })
 
         return errors
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python validate.py <path-to-app-config.yml>")
+    parser = argparse.ArgumentParser(description="Validate app-config.yml files")
+    parser.add_argument("configs", nargs="*", help="Paths to app-config.yml files")
+    parser.add_argument(
+        "--from-stdin",
+        action="store_true",
+        help="Read newline-delimited config paths from stdin"
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Report only the most relevant schema error per config"
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the JSON output for humans"
+    )
+    args = parser.parse_args()
+
+    config_paths = [Path(p) for p in args.configs]
+    if args.from_stdin:
+        config_paths.extend(Path(line.strip()) for line in sys.stdin if line.strip())
+
+    if not config_paths:
+        parser.print_usage()
         sys.exit(1)
 
-    config_path = Path(sys.argv[1])
-    validator = AppConfigValidator()
-    is_valid, errors = validator.validate(config_path)
+    # One validator for the whole batch, so the schema is only compiled once
+    validator = AppConfigValidator(fail_fast=args.fail_fast)
+
+    def run(config_path: Path) -> Dict:
+        # One broken file must not abort the report for the rest of the batch
+        try:
+            is_valid, errors = validator.validate(config_path)
+        except Exception as e:
+            is_valid, errors = False, [{
+                "error": f"Validator crashed while checking {config_path}",
+                "details": f"{type(e).__name__}: {e}",
+                "why_this_matters": "We could not check this configuration, so it cannot be deployed",
+                "fix": "Check the file is a readable app-config.yml; if it is, report this to the platform team",
+                "severity": "critical"
+            }]
+        return {
+            "is_valid": is_valid,
+            "config_file": str(config_path),
+            "errors": errors
+        }
+
+    if len(config_paths) == 1:
+        results = [run(config_paths[0])]
+    else:
+        # Overlap file I/O across configs; map() keeps results in input order
+        with ThreadPoolExecutor(max_workers=min(8, len(config_paths))) as executor:
+            results = list(executor.map(run, config_paths))
 
-    result = {
-        "is_valid": is_valid,
-        "config_file": str(config_path),
-        "errors": errors
-    }
+    all_valid = all(result["is_valid"] for result in results)
+    output = results[0] if len(results) == 1 else results
 
-    print(json.dumps(result, indent=2))
+    write_result(output, pretty=args.pretty)
 
-    sys.exit(0 if is_valid else 1)
+    sys.exit(0 if all_valid else 1)
 
 
 if __name__ == '__main__':
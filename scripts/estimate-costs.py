@@ -12,11 +12,18 @@ Output:
     Markdown-formatted cost breakdown
 """
 
+import io
 import sys
 import yaml
 from pathlib import Path
 from typing import Dict, List
 
+# libyaml-backed loader when PyYAML was built with it, pure Python otherwise
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
 # Azure UK South pricing (as of January 2025)
 # Prices in GBP per month unless otherwise noted
 PRICING = {
@@ -49,39 +56,80 @@ PRICING = {
 
 SECONDS_PER_MONTH = 30 * 24 * 60 * 60  # Approximately 2,592,000 seconds
 
+# Monthly container prices per core / per GB, precomputed from per-second rates
+_CPU_MONTHLY = PRICING['container_instance']['cpu_per_core_per_second'] * SECONDS_PER_MONTH
+_MEM_MONTHLY = PRICING['container_instance']['memory_per_gb_per_second'] * SECONDS_PER_MONTH
+
+# Markdown table row used in the cost report
+_ROW = "| {resource} | £{cost:.2f} | {config} | {why} |"
+
+# Static footer of the cost report
+_REPORT_NOTES = """#### ℹ️ Notes
+
+- Prices based on Azure UK South region, January 2025
+- Actual costs may vary based on:
+  - Data transfer (outbound traffic)
+  - Actual container uptime
+  - Database query performance
+  - Azure pricing changes
+- Set up cost alerts in Azure Portal to monitor actual spend
+- Consider destroying dev/test environments when not in use"""
+
 
 class CostEstimator:
     """Estimates Azure costs with explanations"""
 
     def __init__(self, config_path: Path):
-        with open(config_path) as f:
-            self.config = yaml.safe_load(f)
+        # Named stream so YAML errors report the file rather than "<byte string>"
+        stream = io.BytesIO(Path(config_path).read_bytes())
+        stream.name = str(config_path)
+        self._init_state(yaml.load(stream, Loader=_YAMLLoader))
+
+    @classmethod
+    def from_parsed(cls, config: Dict) -> "CostEstimator":
+        """Create an estimator from an already-parsed app config"""
+        estimator = cls.__new__(cls)
+        estimator._init_state(config)
+        return estimator
+
+    def _init_state(self, config: Dict):
+        self.config = config
         self.costs = {}
         self.explanations = []
+        self._result = None
 
     def estimate(self) -> Dict:
         """Calculate all costs and return breakdown"""
+        # Estimators append to costs/explanations, so only run them once
+        if self._result is not None:
+            return self._result
 
         # Container Registry (shared resource)
         self._estimate_acr()
 
+        components = self.config.get('components') or {}
+
         # Backend container
-        if self.config.get('components', {}).get('backend', {}).get('enabled'):
-            self._estimate_backend()
+        backend = components.get('backend') or {}
+        if backend.get('enabled'):
+            self._estimate_backend(backend)
 
         # Frontend container
-        if self.config.get('components', {}).get('frontend', {}).get('enabled'):
-            self._estimate_frontend()
+        frontend = components.get('frontend') or {}
+        if frontend.get('enabled'):
+            self._estimate_frontend(frontend)
 
         # Database
-        if self.config.get('components', {}).get('database', {}).get('enabled'):
-            self._estimate_database()
+        database = components.get('database') or {}
+        if database.get('enabled'):
+            self._estimate_database(database)
 
-        return {
+        self._result = {
             'total': sum(self.costs.values()),
             'breakdown': self.costs,
             'explanations': self.explanations
         }
+        return self._result
 
     def _estimate_acr(self):
         """Estimate Container Registry costs"""
@@ -102,23 +150,22 @@ class CostEstimator:
             )
         })
 
-    def _estimate_backend(self):
+    def _estimate_backend(self, backend: Dict):
         """Estimate backend container costs"""
-        backend = self.config['components']['backend']
         cpu = backend.get('cpu', 1.0)
         memory = backend.get('memory', 1.5)
         port = backend.get('port', 8000)
 
         # Calculate monthly cost
-        cpu_cost = cpu * PRICING['container_instance']['cpu_per_core_per_second'] * SECONDS_PER_MONTH
-        memory_cost = memory * PRICING['container_instance']['memory_per_gb_per_second'] * SECONDS_PER_MONTH
+        cpu_cost = cpu * _CPU_MONTHLY
+        memory_cost = memory * _MEM_MONTHLY
         total_cost = cpu_cost + memory_cost
 
         self.costs['backend'] = total_cost
 
         # Calculate what it would cost with half resources
-        half_cpu_cost = (cpu / 2) * PRICING['container_instance']['cpu_per_core_per_second'] * SECONDS_PER_MONTH
-        half_memory_cost = (memory / 2) * PRICING['container_instance']['memory_per_gb_per_second'] * SECONDS_PER_MONTH
+        half_cpu_cost = (cpu / 2) * _CPU_MONTHLY
+        half_memory_cost = (memory / 2) * _MEM_MONTHLY
         half_total = half_cpu_cost + half_memory_cost
 
         self.explanations.append({
@@ -136,14 +183,13 @@ class CostEstimator:
             )
         })
 
-    def _estimate_frontend(self):
+    def _estimate_frontend(self, frontend: Dict):
         """Estimate frontend container costs"""
-        frontend = self.config['components']['frontend']
         cpu = frontend.get('cpu', 0.5)
         memory = frontend.get('memory', 1.0)
 
-        cpu_cost = cpu * PRICING['container_instance']['cpu_per_core_per_second'] * SECONDS_PER_MONTH
-        memory_cost = memory * PRICING['container_instance']['memory_per_gb_per_second'] * SECONDS_PER_MONTH
+        cpu_cost = cpu * _CPU_MONTHLY
+        memory_cost = memory * _MEM_MONTHLY
         total_cost = cpu_cost + memory_cost
 
         self.costs['frontend'] = total_cost
@@ -160,9 +206,8 @@ class CostEstimator:
             )
         })
 
-    def _estimate_database(self):
+    def _estimate_database(self, database: Dict):
         """Estimate database costs"""
-        database = self.config['components']['database']
         db_type = database.get('type', 'postgresql')
         tier = database.get('tier', 'Basic').lower().replace(' ', '_')
         storage_mb = database.get('storage_mb', 32768)
@@ -197,56 +242,49 @@ class CostEstimator:
     def generate_markdown_report(self) -> str:
         """Generate markdown-formatted cost report"""
         result = self.estimate()
+        total = result['total']
 
-        lines = []
-        lines.append(f"### 💰 Monthly Cost Estimate: £{result['total']:.2f}")
-        lines.append("")
-        lines.append("| Resource | Cost | Configuration | Why You Need This |")
-        lines.append("|----------|------|---------------|-------------------|")
+        buf = io.StringIO()
+        buf.write(
+            f"### 💰 Monthly Cost Estimate: £{total:.2f}\n"
+            "\n"
+            "| Resource | Cost | Configuration | Why You Need This |\n"
+            "|----------|------|---------------|-------------------|\n"
+        )
 
         for exp in result['explanations']:
-            cost_str = f"£{exp['cost']:.2f}"
-            config_str = exp.get('config', 'N/A')
-            why_str = exp['why']
-            lines.append(f"| {exp['resource']} | {cost_str} | {config_str} | {why_str} |")
+            buf.write(_ROW.format(
+                resource=exp['resource'],
+                cost=exp['cost'],
+                config=exp.get('config', 'N/A'),
+                why=exp['why']
+            ))
+            buf.write("\n")
 
-        lines.append("")
-        lines.append("#### 💡 Cost Breakdown Details")
-        lines.append("")
+        buf.write("\n#### 💡 Cost Breakdown Details\n\n")
 
         for exp in result['explanations']:
             if 'breakdown' in exp:
-                lines.append(f"**{exp['resource']}:**")
-                lines.append(f"- {exp['breakdown']}")
-                lines.append("")
+                buf.write(f"**{exp['resource']}:**\n- {exp['breakdown']}\n\n")
 
-        lines.append("#### 💸 Cost Saving Tips")
-        lines.append("")
+        buf.write("#### 💸 Cost Saving Tips\n\n")
 
         for exp in result['explanations']:
             if 'savings_tip' in exp:
-                lines.append(f"- **{exp['resource']}:** {exp['savings_tip']}")
-
-        lines.append("")
-        lines.append(f"**Total estimated monthly cost: £{result['total']:.2f}**")
-        lines.append("")
-        lines.append("#### 📊 Annual Projection")
-        annual = result['total'] * 12
-        lines.append(f"- Annual cost: £{annual:.2f}")
-        lines.append(f"- Using Azure free credits (£200): Covers ~{200 / result['total']:.1f} months")
-        lines.append("")
-        lines.append("#### ℹ️ Notes")
-        lines.append("")
-        lines.append("- Prices based on Azure UK South region, January 2025")
-        lines.append("- Actual costs may vary based on:")
-        lines.append("  - Data transfer (outbound traffic)")
-        lines.append("  - Actual container uptime")
-        lines.append("  - Database query performance")
-        lines.append("  - Azure pricing changes")
-        lines.append("- Set up cost alerts in Azure Portal to monitor actual spend")
-        lines.append("- Consider destroying dev/test environments when not in use")
-
-        return "\n".join(lines)
+                buf.write(f"- **{exp['resource']}:** {exp['savings_tip']}\n")
+
+        buf.write(
+            "\n"
+            f"**Total estimated monthly cost: £{total:.2f}**\n"
+            "\n"
+            "#### 📊 Annual Projection\n"
+            f"- Annual cost: £{total * 12:.2f}\n"
+            f"- Using Azure free credits (£200): Covers ~{200 / total:.1f} months\n"
+            "\n"
+        )
+        buf.write(_REPORT_NOTES)
+
+        return buf.getvalue()
 
 
 def main():